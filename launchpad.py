@@ -21,6 +21,39 @@ MODES = {
 }
 MODE_STATUS = {v["status"]: k for k, v in MODES.items()}
 MODE_NOTES = {v["note"]: k for k, v in MODES.items()}
+MAX_LEDS_PER_MESSAGE = 80
+
+
+def _chunks(notes, size=MAX_LEDS_PER_MESSAGE):
+    notes = list(notes)
+    return [notes[i:i + size] for i in range(0, len(notes), size)]
+
+
+def encode_clear():
+    return [HEADER + [0x0E, 0x00, 0xF7]]
+
+
+def encode_solid(r, g, b, notes=ALL_NOTES):
+    # 0x0B accepts up to 80 repeated <LED> <R> <G> <B> groups per message
+    return [HEADER + [0x0B] + [v for note in chunk for v in (note, r, g, b)] + [0xF7] for chunk in _chunks(notes)]
+
+
+def encode_palette(color, notes=ALL_NOTES):
+    if notes == ALL_NOTES:
+        return [HEADER + [0x0E, color, 0xF7]]
+    return [HEADER + [0x0A] + [v for note in chunk for v in (note, color)] + [0xF7] for chunk in _chunks(notes)]
+
+
+def encode_effect(effect_type, color):
+    return [HEADER + [effect_type, 0x00, note, color, 0xF7] for note in ALL_NOTES]
+
+
+def encode_text(color, speed, message):
+    return [HEADER + [0x14, color, 0x00, speed] + [ord(c) for c in message] + [0xF7]]
+
+
+def encode_sysex(bytes_list):
+    return [HEADER + bytes_list + [0xF7]]
 
 
 class Launchpad:
@@ -43,9 +76,10 @@ class Launchpad:
         self.midi_in.open_port(in_idx)
         print(f"✅ Connected to: {out_ports[out_idx]} (out), {in_ports[in_idx]} (in)")
 
-    def disconnect(self):
+    def disconnect(self, clear=True):
         if self.midi_out:
-            self.clear()
+            if clear:
+                self.clear()
             try:
                 self.midi_out.close_port()
             except Exception as e:
@@ -77,30 +111,28 @@ class Launchpad:
         self.current_mode = mode_name
         return mode_name
 
+    def send_messages(self, messages):
+        send = self.midi_out.send_message
+        for message in messages:
+            send(message)
+
     def clear(self):
-        self.midi_out.send_message(HEADER + [0x0E, 0x00, 0xF7])
+        self.send_messages(encode_clear())
 
     def solid(self, r, g, b, notes=ALL_NOTES):
-        for note in notes:
-            self.midi_out.send_message(HEADER + [0x0B, note, r, g, b, 0xF7])
+        self.send_messages(encode_solid(r, g, b, notes))
 
     def palette(self, color, notes=ALL_NOTES):
-        if notes == ALL_NOTES:
-            self.midi_out.send_message(HEADER + [0x0E, color, 0xF7])
-        else:
-            for note in notes:
-                self.midi_out.send_message(HEADER + [0x0A, note, color, 0xF7])
+        self.send_messages(encode_palette(color, notes))
 
     def effect(self, effect_type, color):
-        for note in ALL_NOTES:
-            self.midi_out.send_message(HEADER + [effect_type, 0x00, note, color, 0xF7])
+        self.send_messages(encode_effect(effect_type, color))
 
     def text(self, color, speed, message):
-        text_bytes = [ord(c) for c in message]
-        self.midi_out.send_message(HEADER + [0x14, color, 0x00, speed] + text_bytes + [0xF7])
+        self.send_messages(encode_text(color, speed, message))
 
     def send_sysex(self, bytes_list):
-        self.midi_out.send_message(HEADER + bytes_list + [0xF7])
+        self.send_messages(encode_sysex(bytes_list))
 
     def send_raw(self, bytes_list):
         self.midi_out.send_message(bytes_list)
@@ -1,36 +1,165 @@
+import argparse
 import asyncio
 import os
-from launchpad import Launchpad, ALL_NOTES
+import re
+import sys
+import time
+from launchpad import (
+    Launchpad, ALL_NOTES, MODES, encode_clear, encode_solid, encode_palette, encode_effect, encode_text, encode_sysex,
+)
 
 COMMANDS = {}
+SCRIPT_COMMANDS = {}
+# A comment is a line starting with '#', or a '#' standing alone after whitespace ("solid 5  # red"),
+# so text like "Show #1" is left intact.
+COMMENT_RE = re.compile(r"^\s*#.*|\s#(?:\s.*)?$")
 
 
-def register_command(name):
+def register_command(name, registry=COMMANDS):
     def decorator(func):
-        COMMANDS[name] = func
+        registry[name] = func
         return func
     return decorator
 
 
-def parse_int(val, min_val, max_val, name="value"):
+def to_int(val, min_val, max_val, name="value"):
     try:
         v = int(val, 16) if isinstance(val, str) and val.lower().startswith("0x") else int(val)
-        if not min_val <= v <= max_val:
-            raise ValueError
-        return v
     except Exception:
-        print(f"❌ {name} must be {min_val}–{max_val}.")
-        return None
+        v = None
+    if v is None or not min_val <= v <= max_val:
+        raise ValueError(f"{name} must be {min_val}–{max_val}.")
+    return v
 
 
-def parse_note_list(note_str):
+def to_note_list(note_str):
+    note_str = str(note_str)
     if not note_str.strip():
         return ALL_NOTES
     try:
-        return [int(n.strip()) for n in note_str.split(",") if n.strip()]
+        notes = [int(n.strip()) for n in note_str.split(",") if n.strip()]
     except Exception:
-        print("❌ Invalid note number(s).")
-        return None
+        raise ValueError("Invalid note number(s).") from None
+    invalid = [n for n in notes if n not in ALL_NOTES]
+    if invalid:
+        raise ValueError(f"Invalid note number(s): {', '.join(map(str, invalid))}")
+    return notes
+
+
+def to_hex_bytes(args, max_val=0x7F):
+    try:
+        bytes_list = [int(str(x), 16) for x in args]
+    except ValueError:
+        raise ValueError(f"Invalid hex: {' '.join(map(str, args))}") from None
+    if not bytes_list or any(not 0 <= b <= max_val for b in bytes_list):
+        raise ValueError(f"Bytes must be hex 00–{max_val:02X}: {' '.join(map(str, args))}")
+    return bytes_list
+
+
+# Each compiler validates its arguments and encodes them into steps of ("send", messages),
+# ("wait", seconds) or ("call", func), plus a status message. The interactive commands and
+# script mode both go through these, so validation is shared.
+
+@register_command("clear", SCRIPT_COMMANDS)
+def compile_clear(_args):
+    return [("send", encode_clear())], "All pads cleared."
+
+
+@register_command("solid", SCRIPT_COMMANDS)
+def compile_solid(args):
+    if not args:
+        raise ValueError("Usage: solid <r> <g> <b> [notes]  or  solid <palette> [notes]")
+    if len(args) >= 3:
+        r, g, b = (to_int(args[i], 0, 63, c) for i, c in enumerate(("Red", "Green", "Blue")))
+        notes = to_note_list(args[3]) if len(args) > 3 else ALL_NOTES
+        return [("send", encode_solid(r, g, b, notes))], f"Notes set to RGB ({r}, {g}, {b})"
+    color = to_int(args[0], 0, 127, "Palette")
+    notes = to_note_list(args[1]) if len(args) > 1 else ALL_NOTES
+    return [("send", encode_palette(color, notes))], f"Notes set to palette color {color}"
+
+
+def compile_effect_command(effect_type, effect_name):
+    @register_command(effect_name, SCRIPT_COMMANDS)
+    def compiler(args):
+        if not args:
+            raise ValueError(f"Usage: {effect_name} <color_index>")
+        color = to_int(args[0], 0, 127, "Color index")
+        return [("send", encode_effect(effect_type, color))], \
+            f"{effect_name.capitalize()} effect set to color index {color}"
+    return compiler
+
+
+compile_pulse = compile_effect_command(0x28, "pulse")
+compile_flash = compile_effect_command(0x23, "flash")
+
+
+@register_command("text", SCRIPT_COMMANDS)
+def compile_text(args):
+    if len(args) < 3:
+        raise ValueError("Usage: text <color (0-127)> <speed (0-7)> <message>")
+    color, speed = to_int(args[0], 0, 127, "Color"), to_int(args[1], 0, 7, "Speed")
+    message = ' '.join(map(str, args[2:]))
+    if any(ord(c) > 127 for c in message):
+        raise ValueError("Text must be ASCII.")
+    return [("send", encode_text(color, speed, message))], \
+        f"Displaying text: {message} color {color} speed {speed}"
+
+
+@register_command("tempo", SCRIPT_COMMANDS)
+def compile_tempo(args):
+    if not args:
+        raise ValueError("Usage: tempo <bpm (40-240)> [count]")
+    bpm = to_int(args[0], 40, 240, "BPM")
+    count = to_int(args[1], 1, 10000, "Count") if len(args) > 1 else 32
+    return [("call", lambda lp: asyncio.run(lp.send_tempo_loop(bpm, count)))], f"Sent {count} tempo messages."
+
+
+@register_command("send", SCRIPT_COMMANDS)
+def compile_send(args):
+    bytes_list = to_hex_bytes(args)
+    return [("send", encode_sysex(bytes_list))], f"Sent SysEx: {bytes_list}"
+
+
+@register_command("sendraw", SCRIPT_COMMANDS)
+def compile_sendraw(args):
+    bytes_list = to_hex_bytes(args, 0xFF)
+    return [("send", [bytes_list])], f"Sent SysEx: {bytes_list}"
+
+
+@register_command("mode", SCRIPT_COMMANDS)
+def compile_mode(args):
+    if not args or args[0] not in MODES:
+        raise ValueError(f"Usage: mode <{'|'.join(MODES.keys())}>")
+    mode_name = args[0]
+    return [("call", lambda lp: lp.set_mode(mode_name))], f"Switched to {mode_name} mode"
+
+
+@register_command("wait", SCRIPT_COMMANDS)
+def compile_wait(args):
+    if not args:
+        raise ValueError("Usage: wait <ms>")
+    ms = to_int(args[0], 0, 86400000, "Wait (ms)")
+    return [("wait", ms / 1000)], f"Waited {ms} ms"
+
+
+def run_steps(lp, steps):
+    for kind, payload in steps:
+        if kind == "send":
+            lp.send_messages(payload)
+        elif kind == "wait":
+            time.sleep(payload)
+        else:
+            payload(lp)
+
+
+def run_compiled(lp, compiler, args):
+    try:
+        steps, message = compiler(args)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    run_steps(lp, steps)
+    print(f"✅ {message}")
 
 
 @register_command("help")
@@ -63,103 +192,46 @@ def cmd_exit(lp, _):
 
 
 @register_command("clear")
-def cmd_clear(lp, _):
-    lp.clear()
-    print("✅ All pads cleared.")
+def cmd_clear(lp, args):
+    run_compiled(lp, compile_clear, args)
 
 
 @register_command("solid")
 def cmd_solid(lp, args):
-    if not args:
-        print("❌ Usage: solid <r> <g> <b> [notes]  or  solid <palette> [notes]")
-        return
-    if len(args) >= 3:
-        r, g, b = (parse_int(args[i], 0, 63, c) for i, c in enumerate(("Red", "Green", "Blue")))
-        if None in (r, g, b):
-            return
-        notes = parse_note_list(args[3]) if len(args) > 3 else ALL_NOTES
-        if notes is None:
-            return
-        lp.solid(r, g, b, notes)
-        print(f"✅ Notes set to RGB ({r}, {g}, {b})")
-    else:
-        color = parse_int(args[0], 0, 127, "Palette")
-        if color is None:
-            return
-        notes = parse_note_list(args[1]) if len(args) > 1 else ALL_NOTES
-        if notes is None:
-            return
-        lp.palette(color, notes)
-        print(f"✅ Notes set to palette color {color}")
-
-
-def effect_command(effect_type, effect_name):
-    @register_command(effect_name)
-    def handler(lp, args):
-        if not args:
-            print(f"❌ Usage: {effect_name} <color_index>")
-            return
-        color = parse_int(args[0], 0, 127, "Color index")
-        if color is None:
-            return
-        lp.effect(effect_type, color)
-        print(f"✅ {effect_name.capitalize()} effect set to color index {color}")
+    run_compiled(lp, compile_solid, args)
+
+
+@register_command("pulse")
+def cmd_pulse(lp, args):
+    run_compiled(lp, compile_pulse, args)
 
 
-effect_command(0x28, "pulse")
-effect_command(0x23, "flash")
+@register_command("flash")
+def cmd_flash(lp, args):
+    run_compiled(lp, compile_flash, args)
 
 
 @register_command("text")
 def cmd_text(lp, args):
-    if len(args) < 3:
-        print("❌ Usage: text <color (0-127)> <speed (0-7)> <message>")
-        return
-    color, speed = parse_int(args[0], 0, 127, "Color"), parse_int(args[1], 0, 7, "Speed")
-    if color is None or speed is None:
-        return
-    message = ' '.join(args[2:])
-    lp.text(color, speed, message)
-    print(f"✅ Displaying text: {message} color {color} speed {speed}")
+    run_compiled(lp, compile_text, args)
 
 
 @register_command("tempo")
 def cmd_tempo(lp, args):
-    if not args:
-        print("❌ Usage: tempo <bpm (40-240)> [count]")
-        return
-    bpm = parse_int(args[0], 40, 240, "BPM")
-    count = parse_int(args[1], 1, 10000, "Count") if len(args) > 1 else 32
-    if bpm is None:
-        return
-
-    async def run_tempo():
-        await lp.send_tempo_loop(bpm, count)
-        print(f"\n✅ Sent {count} tempo messages.")
     try:
-        asyncio.run(run_tempo())
+        run_compiled(lp, compile_tempo, args)
     except KeyboardInterrupt:
         pass
 
 
 @register_command("send")
 def cmd_send(lp, args):
-    try:
-        bytes_list = [int(x, 16) for x in args]
-        lp.send_sysex(bytes_list)
-        print(f"✅ Sent SysEx: {bytes_list}")
-    except ValueError:
-        print("❌ Invalid hex. Example: send 0B 11 3F 00 00")
+    run_compiled(lp, compile_send, args)
 
 
 @register_command("sendraw")
 def cmd_sendraw(lp, args):
-    try:
-        bytes_list = [int(x, 16) for x in args]
-        lp.send_raw(bytes_list)
-        print(f"✅ Sent SysEx: {bytes_list}")
-    except ValueError:
-        print("❌ Invalid hex. Example: sendraw F0 00 20 29 ... F7")
+    run_compiled(lp, compile_sendraw, args)
 
 
 @register_command("reconnect")
@@ -170,7 +242,7 @@ def cmd_reconnect(lp, _):
 
 @register_command("mode")
 def cmd_mode(lp, args):
-    lp.set_mode(args[0])
+    run_compiled(lp, compile_mode, args)
 
 
 @register_command("consoleclear")
@@ -196,7 +268,102 @@ def cmd_listenoff(lp, _):
         print("🛑 Listener is not running.")
 
 
-def main():
+def strip_comment(line):
+    return COMMENT_RE.sub("", line)
+
+
+def compile_script(lines):
+    """Validate and encode a whole script; returns (steps, command_count) or raises ValueError.
+
+    The count leaves out `wait` directives, so it only covers commands that touch the Launchpad.
+    """
+    steps, count, errors = [], 0, []
+    for lineno, line in enumerate(lines, 1):
+        parts = strip_comment(line).split()
+        if not parts:
+            continue
+        cmd, args = parts[0].lower(), parts[1:]
+        if cmd not in SCRIPT_COMMANDS:
+            errors.append(f"line {lineno}: Unknown command: {cmd}")
+            continue
+        try:
+            new_steps, _ = SCRIPT_COMMANDS[cmd](args)
+        except ValueError as e:
+            errors.append(f"line {lineno}: {e}")
+            continue
+        if cmd != "wait":
+            count += 1
+        for kind, payload in new_steps:
+            # Merge consecutive sends so they go out as one batch
+            if kind == "send" and steps and steps[-1][0] == "send":
+                steps[-1][1].extend(payload)
+            else:
+                steps.append((kind, list(payload) if kind == "send" else payload))
+    if errors:
+        raise ValueError("\n".join(errors))
+    return steps, count
+
+
+def run_script(lp, steps):
+    """Run compiled steps; returns seconds spent per step kind."""
+    timings = {"send": 0.0, "wait": 0.0, "call": 0.0}
+    for step in steps:
+        start = time.perf_counter()
+        run_steps(lp, [step])
+        timings[step[0]] += time.perf_counter() - start
+    return timings
+
+
+def main_script(source, bench=False):
+    start = time.perf_counter()
+    try:
+        if source == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(source, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+    except OSError as e:
+        print(f"❌ Could not read script: {e}", file=sys.stderr)
+        return 1
+    try:
+        steps, count = compile_script(lines)
+    except ValueError as e:
+        for error in str(e).splitlines():
+            print(f"❌ {error}", file=sys.stderr)
+        return 1
+    if not steps:
+        print("❌ Script contains no commands.", file=sys.stderr)
+        return 1
+    compiled = time.perf_counter()
+
+    try:
+        lp = Launchpad()
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+    lp.set_mode("session")
+    connected = time.perf_counter()
+    try:
+        timings = run_script(lp, steps)
+    except KeyboardInterrupt:
+        print("🛑 Script interrupted.", file=sys.stderr)
+        return 130
+    finally:
+        # Leave the final state of the show on the pads
+        lp.disconnect(clear=False)
+
+    if bench:
+        ms = {kind: t * 1000 for kind, t in timings.items()}
+        busy = ms.get("send", 0.0) + ms.get("call", 0.0)
+        print(f"⏱️  {count} commands: parse {(compiled - start) * 1000:.2f} ms, "
+              f"connect {(connected - compiled) * 1000:.2f} ms, send {ms.get('send', 0.0):.2f} ms, "
+              f"tempo/mode {ms.get('call', 0.0):.2f} ms, wait {ms.get('wait', 0.0):.2f} ms, "
+              f"total {(time.perf_counter() - start) * 1000:.2f} ms, "
+              f"{busy / max(count, 1):.3f} ms/command excluding waits")
+    return 0
+
+
+def main_interactive():
     lp = Launchpad()
     lp.set_mode("session")
     lp.listen_to_input()
@@ -212,10 +379,24 @@ def main():
                 COMMANDS[cmd](lp, args)
             else:
                 print(f"❓ Unknown command: {cmd}. Try 'help'.")
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, EOFError):
         lp.disconnect()
         print("👋 Exiting...")
 
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Launchpad MK2 SysEx shell.")
+    parser.add_argument("-f", "--file", help="run a script file non-interactively ('-' or piped input reads stdin)")
+    parser.add_argument("--bench", action="store_true", help="report parse/run timings in script mode")
+    args = parser.parse_args(argv)
+    source = args.file or (None if sys.stdin.isatty() else "-")
+    if args.bench and source is None:
+        parser.error("--bench requires -f")
+    if source is None:
+        main_interactive()
+        return 0
+    return main_script(source, args.bench)
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
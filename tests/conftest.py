@@ -0,0 +1,29 @@
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakePort:
+    def __init__(self):
+        self.sent = []
+
+    def get_ports(self):
+        return ["Launchpad MK2"]
+
+    def open_port(self, _idx):
+        pass
+
+    def close_port(self):
+        pass
+
+    def send_message(self, message):
+        self.sent.append(message)
+
+    def set_callback(self, _callback):
+        pass
+
+
+# python-rtmidi needs real MIDI hardware/drivers, so stub it before launchpad is imported
+sys.modules.setdefault("rtmidi", types.SimpleNamespace(MidiOut=FakePort, MidiIn=FakePort))
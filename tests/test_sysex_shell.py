@@ -0,0 +1,173 @@
+import io
+
+import pytest
+
+import sysex_shell
+from launchpad import HEADER, ALL_NOTES, Launchpad, encode_solid, encode_palette, encode_effect, encode_text
+
+
+def test_encode_solid_packs_leds_into_one_message():
+    assert encode_solid(63, 0, 1, [11, 12]) == [HEADER + [0x0B, 11, 63, 0, 1, 12, 63, 0, 1, 0xF7]]
+    messages = encode_solid(1, 2, 3)
+    assert len(messages) == 1 and len(messages[0]) == len(HEADER) + 1 + 4 * len(ALL_NOTES) + 1
+
+
+def test_encode_solid_splits_after_80_leds():
+    messages = encode_solid(1, 2, 3, ALL_NOTES + [11])
+    assert [len(m) for m in messages] == [len(HEADER) + 2 + 4 * 80, len(HEADER) + 2 + 4]
+
+
+def test_encode_palette():
+    assert encode_palette(5) == [HEADER + [0x0E, 5, 0xF7]]
+    assert encode_palette(5, [11, 12]) == [HEADER + [0x0A, 11, 5, 12, 5, 0xF7]]
+
+
+def test_encode_effect_and_text():
+    assert encode_effect(0x28, 3)[0] == HEADER + [0x28, 0x00, ALL_NOTES[0], 3, 0xF7]
+    assert encode_text(5, 3, "Hi") == [HEADER + [0x14, 5, 0x00, 3, ord("H"), ord("i"), 0xF7]]
+
+
+def test_to_int():
+    assert sysex_shell.to_int("0x10", 0, 127) == 16
+    assert sysex_shell.to_int(7, 0, 7) == 7
+    with pytest.raises(ValueError, match="Speed must be 0–7"):
+        sysex_shell.to_int("8", 0, 7, "Speed")
+    with pytest.raises(ValueError):
+        sysex_shell.to_int("abc", 0, 7)
+
+
+def test_to_note_list():
+    assert sysex_shell.to_note_list("11, 12") == [11, 12]
+    assert sysex_shell.to_note_list("") is ALL_NOTES
+    with pytest.raises(ValueError, match="300, 999"):
+        sysex_shell.to_note_list("11,300,999")
+    with pytest.raises(ValueError):
+        sysex_shell.to_note_list("10")
+
+
+def test_to_hex_bytes():
+    assert sysex_shell.to_hex_bytes(["0B", "7F"]) == [0x0B, 0x7F]
+    with pytest.raises(ValueError):
+        sysex_shell.to_hex_bytes(["80"])
+    assert sysex_shell.to_hex_bytes(["F0", "F7"], 0xFF) == [0xF0, 0xF7]
+    with pytest.raises(ValueError):
+        sysex_shell.to_hex_bytes(["zz"], 0xFF)
+    with pytest.raises(ValueError):
+        sysex_shell.to_hex_bytes([])
+
+
+def test_compile_script_merges_sends_and_keeps_waits():
+    steps, count = sysex_shell.compile_script(["solid 5", "clear", "wait 250", "mode user1", "send 0B 11 3F 00 00"])
+    assert count == 4
+    assert [kind for kind, _ in steps] == ["send", "wait", "call", "send"]
+    assert steps[0][1] == [HEADER + [0x0E, 5, 0xF7], HEADER + [0x0E, 0x00, 0xF7]]
+    assert steps[1][1] == 0.25
+
+
+def test_compile_script_comments():
+    steps, count = sysex_shell.compile_script(["# intro", "", "  # indented", "text 5 3 Show #1  # title"])
+    assert count == 1
+    assert steps[0][1] == encode_text(5, 3, "Show #1")
+
+
+def test_compile_script_reports_every_error_with_line_numbers():
+    with pytest.raises(ValueError) as excinfo:
+        sysex_shell.compile_script(["solid 5", "bogus", "solid 63 0 0 11,300", "send 80 FF", "wait"])
+    assert str(excinfo.value).splitlines() == [
+        "line 2: Unknown command: bogus",
+        "line 3: Invalid note number(s): 300",
+        "line 4: Bytes must be hex 00–7F: 80 FF",
+        "line 5: Usage: wait <ms>",
+    ]
+
+
+def test_interactive_command_shares_script_validation(capsys):
+    lp = Launchpad()
+    sysex_shell.COMMANDS["send"](lp, ["80"])
+    sysex_shell.COMMANDS["text"](lp, ["5", "3", "héllo"])
+    sysex_shell.COMMANDS["solid"](lp, ["1", "2", "3", "11,12"])
+    out = capsys.readouterr().out
+    assert "❌ Bytes must be hex 00–7F: 80" in out
+    assert "❌ Text must be ASCII." in out
+    assert "✅ Notes set to RGB (1, 2, 3)" in out
+    assert lp.midi_out.sent == encode_solid(1, 2, 3, [11, 12])
+
+
+def test_main_script_missing_file(capsys):
+    assert sysex_shell.main(["-f", "does-not-exist.txt"]) == 1
+    assert "❌ Could not read script" in capsys.readouterr().err
+
+
+def test_main_script_keeps_final_state(tmp_path, monkeypatch, capsys):
+    script = tmp_path / "show.txt"
+    script.write_text("solid 5\n", encoding="utf-8")
+    sent = []
+    monkeypatch.setattr(Launchpad, "send_messages", lambda self, messages: sent.extend(messages))
+    assert sysex_shell.main(["-f", str(script), "--bench"]) == 0
+    assert sent == [HEADER + [0x0E, 5, 0xF7]]
+    assert "ms/command excluding waits" in capsys.readouterr().out
+
+
+def test_main_script_empty(tmp_path, capsys):
+    script = tmp_path / "empty.txt"
+    script.write_text("# nothing\n", encoding="utf-8")
+    assert sysex_shell.main(["-f", str(script)]) == 1
+    assert "no commands" in capsys.readouterr().err
+
+
+class TtyInput(io.StringIO):
+    def isatty(self):
+        return True
+
+
+def test_main_reads_piped_stdin(monkeypatch, capsys):
+    sent = []
+    monkeypatch.setattr(Launchpad, "send_messages", lambda self, messages: sent.extend(messages))
+    monkeypatch.setattr("sys.stdin", io.StringIO("solid 5\nwait 1\nwait 1\nwait 1\n"))
+    assert sysex_shell.main(["--bench"]) == 0
+    assert sent == [HEADER + [0x0E, 5, 0xF7]]
+    out = capsys.readouterr().out
+    assert "🧠" not in out and "1 commands" in out
+
+
+def test_main_reads_stdin_with_dash(monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO("bogus\n"))
+    assert sysex_shell.main(["-f", "-"]) == 1
+
+
+def test_main_bench_requires_script(monkeypatch):
+    monkeypatch.setattr("sys.stdin", TtyInput())
+    with pytest.raises(SystemExit) as excinfo:
+        sysex_shell.main(["--bench"])
+    assert excinfo.value.code == 2
+
+
+def test_main_script_interrupted(tmp_path, monkeypatch, capsys):
+    script = tmp_path / "show.txt"
+    script.write_text("solid 5\n", encoding="utf-8")
+
+    def interrupt(_lp, _steps):
+        raise KeyboardInterrupt
+    monkeypatch.setattr(sysex_shell, "run_script", interrupt)
+    assert sysex_shell.main(["-f", str(script), "--bench"]) == 130
+    captured = capsys.readouterr()
+    assert "⏱️" not in captured.out and "interrupted" in captured.err
+
+
+def test_main_script_launchpad_missing(tmp_path, monkeypatch, capsys):
+    script = tmp_path / "show.txt"
+    script.write_text("solid 5\n", encoding="utf-8")
+
+    def missing(self):
+        raise RuntimeError("❌ Could not find Launchpad input/output.")
+    monkeypatch.setattr(Launchpad, "__init__", missing)
+    assert sysex_shell.main(["-f", str(script)]) == 1
+    assert "❌ Could not find Launchpad" in capsys.readouterr().err
+
+
+def test_interactive_exits_cleanly_on_eof(monkeypatch, capsys):
+    def eof(_prompt):
+        raise EOFError
+    monkeypatch.setattr("builtins.input", eof)
+    sysex_shell.main_interactive()
+    assert "👋 Exiting..." in capsys.readouterr().out